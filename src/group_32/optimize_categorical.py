@@ -1,10 +1,59 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-import numpy as np
+
+from .optimize_numeric import _MIN_PARALLEL_COLUMNS
+
+
+# Columns longer than this get a cheap sampled cardinality estimate before
+# any full-column work; the sample is capped at roughly this many rows.
+_SAMPLE_MIN_ROWS = 100_000
+_SAMPLE_SIZE = 10_000
+
+
+def _likely_high_cardinality(series, n_rows, max_unique_ratio):
+    """
+    Provably safe reject for very long columns.
+
+    The distinct count of a strided ~10k-row sample is a lower bound on
+    the full column's distinct count, so once the sample alone holds more
+    distinct values than the conversion limit allows, the column can never
+    qualify and the full scan is skipped. Every other column falls through
+    to the exact check, so conversion decisions match a full scan.
+    """
+    if n_rows <= _SAMPLE_MIN_ROWS:
+        return False
+    sample = series.iloc[:: max(1, n_rows // _SAMPLE_SIZE)]
+    return sample.nunique() > max_unique_ratio * n_rows
+
+
+# Chunk size for the early-exit cardinality probe below.
+_PROBE_CHUNK_ROWS = 4096
+
+
+def _cardinality_exceeds(values, limit):
+    """
+    Return True as soon as more than ``limit`` distinct entries are seen.
+
+    The probe hashes one chunk at a time through pandas' C hashtable
+    (pd.unique) and merges the chunk's uniques into a running set, so
+    high-cardinality columns (IDs, free text) are rejected after a
+    fraction of the rows instead of paying a full hash pass only to
+    discover they will not be converted. Chunking keeps the Python-level
+    work at one iteration per ~4k rows rather than per element.
+    """
+    seen = set()
+    for start in range(0, len(values), _PROBE_CHUNK_ROWS):
+        seen.update(pd.unique(values[start:start + _PROBE_CHUNK_ROWS]))
+        if len(seen) > limit:
+            return True
+    return False
 
 
 def optimize_categorical(df: pd.DataFrame, max_unique_ratio: float = 0.5) -> pd.DataFrame:
     """
-    This function makes a copy of a DataFrame (df) and looks through all the string columns. 
+    This function looks through all the string columns of a DataFrame (df) without modifying it.
     It counts the number of unique strings and calculates the ratio of the unique values to the total number of rows. 
     If this ratio is below a chosen threshold in this function, it converts the column to category dtype.
     This function returns a dataframe with the converted columns and prints the number of columns that have been updated.
@@ -67,7 +116,8 @@ def optimize_categorical(df: pd.DataFrame, max_unique_ratio: float = 0.5) -> pd.
     Notes
     -----
     - Only processes columns with 'object' dtype (typically strings)
-    - Prints the number of columns successfully converted
+    - Prints the number of columns successfully converted; the same count is
+      available as ``result.attrs["converted_columns"]``
     - Conversion is reversible using .astype('object') if needed
     - Categorical columns maintain the same values and ordering
     """
@@ -76,38 +126,84 @@ def optimize_categorical(df: pd.DataFrame, max_unique_ratio: float = 0.5) -> pd.
         raise TypeError("df must be a pandas DataFrame")
 
     #check if threshold input is a int or float or invalid
-    if not isinstance(max_unique_ratio, (int, float)) or np.isnan(max_unique_ratio):
+    #(x != x is the plain-Python NaN test; no ufunc dispatch on a scalar)
+    if not isinstance(max_unique_ratio, (int, float)) or max_unique_ratio != max_unique_ratio:
         raise TypeError("max_unique_ratio must be a number")
 
     #check is threshold is negtive or larger than 1
     if max_unique_ratio < 0 or max_unique_ratio > 1:
         raise TypeError("max_unique_ratio must be between 0 and 1 (inclusive)!")
 
-    df_copy = df.copy()
-
-    n_rows = len(df_copy)
+    n_rows = len(df)
     if n_rows == 0:
-
-        return df_copy
-
-    converted_columns = 0
-
-    for col in df_copy.select_dtypes(include=["object"]).columns:
-        n_col = df_copy[col]
-
-        if n_col.isnull().all(): #if the column is empty, terminate the current loop
-            continue
-
-        n_unique = n_col.nunique(dropna=False)
-        ratio = n_unique / n_rows
-        
-        if ratio <= max_unique_ratio:
-            df_copy[col] = n_col.astype("category")
-            converted_columns  += 1
+        # Shallow copy: nothing to convert, but callers must still get a
+        # frame of their own (mutating the result must not touch the
+        # input, which copy-on-write guarantees even without deep=True)
+        # with the conversion-count metadata present.
+        out = df.copy(deep=False)
+        out.attrs["converted_columns"] = 0
+        return out
+
+    # Candidate columns: legacy object columns plus pandas string dtypes
+    # (str / string[pyarrow]). The string dtypes hash through a vectorized
+    # C path — Arrow-backed when pyarrow is installed — instead of paying
+    # per-object CPython hashing, and selecting them explicitly avoids the
+    # deprecated object-dtype fallback in select_dtypes. Columns are
+    # addressed by position throughout, like optimize_numeric: duplicate
+    # column labels are valid pandas input, and label lookups on them
+    # return sub-frames while label-keyed assembly collapses them.
+    string_idx = frozenset(
+        i for i, dtype in enumerate(df.dtypes)
+        if dtype == object or isinstance(dtype, pd.StringDtype)
+    )
+
+    # Assemble the output column-by-column: converted columns get a new
+    # categorical array, all other columns are passed through by reference
+    # so the input frame is never copied wholesale.
+    def _process(i):
+        n_col = df.iloc[:, i]
+
+        if (i in string_idx
+                and n_col.count() > 0 #skip empty columns (count uses the null mask, no bool array)
+                and not _likely_high_cardinality(n_col, n_rows, max_unique_ratio)
+                and not _cardinality_exceeds(n_col.to_numpy(), max_unique_ratio * n_rows)):
+
+            # factorize hashes the column once and hands back the codes, so
+            # the eventual categorical can be built without a second pass
+            codes, uniques = pd.factorize(n_col, sort=True)
+            n_unique = len(uniques) + (1 if codes.min(initial=0) == -1 else 0)
+            ratio = n_unique / n_rows
+
+            if ratio <= max_unique_ratio:
+                n_col = pd.Series(
+                    pd.Categorical.from_codes(codes, categories=uniques),
+                    index=df.index,
+                    name=n_col.name,
+                )
+
+        return n_col
+
+    positions = range(len(df.columns))
+    if len(df.columns) >= _MIN_PARALLEL_COLUMNS:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = list(pool.map(_process, positions))
+    else:
+        results = [_process(i) for i in positions]
+
+    converted_columns = sum(
+        1 for i in string_idx
+        if isinstance(results[i].dtype, pd.CategoricalDtype)
+    )
 
     if converted_columns  > 0:
         print(f"Converted {converted_columns} column(s) to 'category' dtype.")
 
-    return df_copy
+    # concat preserves duplicate labels; it is lazy under copy-on-write,
+    # so unchanged columns keep referencing the input's buffers.
+    out = pd.concat(results, axis=1) if results else df.copy()
+    # Structured counterpart of the printed summary, so callers (and tests)
+    # can read the count without capturing stdout.
+    out.attrs["converted_columns"] = converted_columns
+    return out
 
     
\ No newline at end of file
@@ -6,7 +6,47 @@ from .optimize_numeric import optimize_numeric
 from .optimize_categorical import optimize_categorical
 from .optimize_special import optimize_special
 
-def optimize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+try:
+    # Optional accelerator: polars runs the same shrink/categorize work
+    # multi-threaded on Arrow buffers and is worth the round-trip on very
+    # large frames. The package works fine without it.
+    import polars as pl
+except ImportError:  # pragma: no cover
+    pl = None
+
+# Row count above which the polars round-trip beats the pandas-only path.
+_POLARS_MIN_ROWS = 1_000_000
+
+
+def _polars_path(df: pd.DataFrame, max_unique_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Run the numeric shrink and categorical conversion through polars.
+
+    Mirrors the pandas pipeline: dtypes are shrunk to the smallest that
+    holds each column's values, and low-cardinality string columns are
+    cast to Categorical. The result comes back as a pandas DataFrame.
+    """
+    plf = pl.from_pandas(df, rechunk=False)
+    plf = plf.with_columns(pl.all().shrink_dtype())
+
+    # A zero-row frame has no cardinality to measure (the ratio below would
+    # divide by zero) and nothing to categorize, so only the dtype shrink
+    # applies.
+    n_rows = plf.height
+    if n_rows == 0:
+        return plf.to_pandas()
+
+    low_card = [
+        col for col, dtype in zip(plf.columns, plf.dtypes)
+        if dtype == pl.String and plf[col].n_unique() / n_rows <= max_unique_ratio
+    ]
+    if low_card:
+        plf = plf.with_columns([pl.col(col).cast(pl.Categorical) for col in low_card])
+
+    return plf.to_pandas()
+
+
+def optimize_dataframe(df: pd.DataFrame, engine: str = "auto") -> pd.DataFrame:
     """
     This function creates an optimized copy of a pandas DataFrame by applying
     a series of memory-reduction strategies while preserving the original data.
@@ -18,14 +58,22 @@ def optimize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     - Special columns (e.g., IDs, coordinates, high-cardinality text) are
       identified and reported but not modified
 
-    The original DataFrame is never mutated; all operations are performed
-    on a copy.
+    The original DataFrame is never mutated; the result is a new DataFrame
+    assembled from the optimized columns.
 
     Parameters
     ----------
     df : pd.DataFrame
         The input pandas DataFrame to be optimized.
 
+    engine : str, default="auto"
+        Which implementation runs the optimization steps:
+        - "auto": use polars for very large frames when it is installed,
+          otherwise the pandas pipeline
+        - "pandas": always use the pandas pipeline
+        - "polars": always use the polars path (raises ImportError when
+          polars is not installed)
+
     Returns
     -------
     pd.DataFrame
@@ -69,11 +117,28 @@ def optimize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     if not isinstance(df, pd.DataFrame):
         raise TypeError("df must be a pandas DataFrame")
 
-    # Always work on copies (helpers already copy, but keep wrapper intent explicit)
-    out = df.copy(deep=True)
+    if engine not in ("auto", "pandas", "polars"):
+        raise TypeError('engine must be one of "auto", "pandas" or "polars"')
+
+    if engine == "polars" and pl is None:
+        raise ImportError(
+            "polars is not installed; install it or use engine='pandas'"
+        )
+
+    # The polars path runs the same shrink/categorize work multi-threaded on
+    # Arrow buffers. Under "auto" it is only worth the round-trip on very
+    # large frames; the analysis step still runs on the optimized result.
+    use_polars = engine == "polars" or (
+        engine == "auto" and pl is not None and len(df) > _POLARS_MIN_ROWS
+    )
+    if use_polars:
+        out = _polars_path(df)
+        optimize_special(out)
+        return out
 
-    # Apply safe optimizations
-    out = optimize_numeric(out)
+    # Apply safe optimizations (helpers return new frames and never mutate
+    # their input, so no defensive copy is needed here)
+    out = optimize_numeric(df)
     out = optimize_categorical(out, max_unique_ratio=0.5)
 
     # Report special columns (no mutation)
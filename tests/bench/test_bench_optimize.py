@@ -0,0 +1,55 @@
+"""
+Micro-benchmarks guarding the optimizers against performance regressions.
+
+The unit tests run on 3-10 row frames, so a quadratic regression (for
+example a Python-level per-value loop sneaking into the cardinality
+check) would pass them unnoticed. These cases run the optimizers on
+1M-row frames shaped like the workloads the package targets.
+
+Skipped by default via --benchmark-skip in addopts. To measure:
+
+    pytest tests/bench --benchmark-only -n 0
+
+(-n 0 because pytest-benchmark needs a single process for stable timings.)
+"""
+
+import numpy as np
+import pandas as pd
+
+from group_32.optimize_categorical import optimize_categorical
+from group_32.optimize_numeric import optimize_numeric
+from group_32.optimize_dataframe import optimize_dataframe
+
+_N_ROWS = 1_000_000
+_RNG = np.random.default_rng(32)
+
+
+def test_bench_categorical_low_cardinality(benchmark):
+    """Convertible string column: full factorize path on 1M rows."""
+    df = pd.DataFrame({"c": _RNG.choice(["A", "B", "C", "D"], _N_ROWS)})
+    benchmark(optimize_categorical, df, max_unique_ratio=0.5)
+
+
+def test_bench_categorical_high_cardinality(benchmark):
+    """ID-like column: the early-reject probes should keep this cheap."""
+    df = pd.DataFrame({"id": np.arange(_N_ROWS).astype(str)})
+    benchmark(optimize_categorical, df, max_unique_ratio=0.5)
+
+
+def test_bench_numeric_downcast(benchmark):
+    """Mixed int/float frame through the numeric shrink."""
+    df = pd.DataFrame({
+        "i": _RNG.integers(0, 100, _N_ROWS),
+        "f": _RNG.random(_N_ROWS),
+    })
+    benchmark(optimize_numeric, df, verbose=False)
+
+
+def test_bench_full_pipeline(benchmark):
+    """End-to-end wrapper on a frame mixing all the column kinds."""
+    df = pd.DataFrame({
+        "user_id": np.arange(_N_ROWS),
+        "status": _RNG.choice(["active", "inactive"], _N_ROWS),
+        "score": _RNG.random(_N_ROWS),
+    })
+    benchmark(optimize_dataframe, df)
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="session")
+def num_arrays():
+    """
+    Preallocated numeric arrays shared across the test session.
+
+    Tests build their frames with pd.DataFrame({...}, copy=False) on top
+    of these buffers, so the per-test cost is frame assembly rather than
+    a fresh numpy allocation every time. The buffers are marked read-only,
+    so any accidental in-place write — by a test or by the code under
+    test — raises instead of silently corrupting shared state. A test that
+    needs to mutate must take its own copy first.
+    """
+    arrays = {
+        "int64_small": np.array([1, 2, 3], dtype=np.int64),
+        "float64_small": np.array([1.5, 2.5, 3.5], dtype=np.float64),
+    }
+    for arr in arrays.values():
+        arr.flags.writeable = False
+    return arrays
+
+
+@pytest.fixture(scope="session")
+def frame_fingerprint():
+    """
+    Cheap structural snapshot for non-mutation checks.
+
+    Returns a callable producing a (dtypes, content hash) pair for a frame.
+    hash_pandas_object is a vectorized C routine, so comparing fingerprints
+    detects any in-place edit without the full-buffer allocation of
+    df.copy(deep=True). Dtypes are captured separately because equal values
+    hash the same across dtypes (object vs category, int64 vs int8).
+    """
+    def _fingerprint(df):
+        return (
+            tuple(df.dtypes),
+            pd.util.hash_pandas_object(df, index=False).values.tobytes(),
+        )
+    return _fingerprint
@@ -0,0 +1,216 @@
+from group_32.optimize_categorical import optimize_categorical
+
+import numpy as np
+import pandas as pd
+import pytest
+import re
+
+# Expected error messages, defined once at import time. Only the bounds
+# message needs re.escape — it contains regex metacharacters; the others are
+# plain literals and pass through match= as-is.
+_BAD_RATIO_MSG = re.escape("max_unique_ratio must be between 0 and 1 (inclusive)!")
+_RATIO_TYPE_MSG = "max_unique_ratio must be a number"
+_NOT_DF_MSG = "df must be a pandas DataFrame"
+
+# Column buffers for the threshold fixture, built once as object arrays so
+# frame construction skips the per-call list traversal and dtype inference.
+_ID_ARR = np.array(["A", "B", "A", "C", "B", "D", "E", "F", "G", "H"], dtype=object)  # 8 unique / 10 = 0.8
+_HOURS_ARR = np.array([23, 40, 12, 77, 85, 12, 64, 64, 46, 37.5])
+_COMPANY_ARR = np.array(
+    ["Comp_A", "Comp_R", "Comp_A", "Comp_D", "Comp_G", "Comp_D", "Comp_A", "Comp_G", "Comp_R", "Comp_A"],
+    dtype=object,
+)  # 4 unique / 10 = 0.4
+_BRAND_ARR = np.array(["A"] * 10, dtype=object)  # 1 unique / 10 = 0.1
+
+
+@pytest.fixture(scope="module")
+def sample_data():
+    """Mixed-type frame shared by the conversion tests, built once per module.
+
+    Read-only consumers can take it as-is (optimize_categorical never mutates
+    its input); any test that writes to it must make its own deep copy.
+    """
+    return pd.DataFrame(
+        {
+            "user_id": list(range(10)),
+            "name": ["Alice", "Bobby", "Charles", "Ally", "Bob", "Charlie", "David", "Alex", "Ben", "Cherry"],
+            "city": ["NYC", "LA", "NYC", "Chicago", "LA", "NYC", "LA", "Chicago", "NYC", "LA"],
+            "status": ["active", "inactive", "active", "active", "inactive", "active", "inactive", "active", "active", "inactive"],
+            "score": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+            "binary_flag": [True, False, True, False, True, False, True, False, True, False]
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def threshold_data():
+    """Frame with a spread of unique ratios for the threshold tests."""
+    return pd.DataFrame.from_dict(
+        {
+            "id": _ID_ARR,
+            "hours": _HOURS_ARR,
+            "company": _COMPANY_ARR,
+            "brand": _BRAND_ARR,
+        },
+        orient="columns",
+    )
+
+
+def test_optimize_categorical_converts_columns(sample_data):
+
+    df = sample_data
+
+    output = optimize_categorical(df, max_unique_ratio=0.5)
+
+    # Test function converts appropriate columns
+    assert str(output["city"].dtype) == "category"
+    assert str(output["status"].dtype) == "category"
+
+    # Test that other columns remain unchanged
+    assert not isinstance(output["name"].dtype, pd.CategoricalDtype)
+    assert df["user_id"].dtype == output["user_id"].dtype
+    assert df["score"].dtype == output["score"].dtype
+    assert df["binary_flag"].dtype == output["binary_flag"].dtype
+
+    # Conversion count is exposed as frame metadata; no stdout capture needed
+    assert output.attrs["converted_columns"] == 2
+
+def test_optimize_categorical_threshold(threshold_data):
+    df = threshold_data
+
+    # Snapshot the input as a (dtypes, content hash) fingerprint instead of
+    # a deep copy; hash_pandas_object is a vectorized C routine and catches
+    # any in-place mutation just as reliably.
+    before = (
+        tuple(df.dtypes),
+        pd.util.hash_pandas_object(df, index=False).values.tobytes(),
+    )
+
+    output2 = optimize_categorical(df, max_unique_ratio=1)
+
+    # Test threshold = 1 (convert all string columns)
+    assert str(output2["id"].dtype) == "category"
+    assert str(output2["company"].dtype) == "category"
+    assert str(output2["brand"].dtype) == "category"
+
+    # Test threshold = 0 (convert none): output matches the input fingerprint
+    output3 = optimize_categorical(df, max_unique_ratio=0)
+    assert (
+        tuple(output3.dtypes),
+        pd.util.hash_pandas_object(output3, index=False).values.tobytes(),
+    ) == before
+
+    # ...and the input itself was never mutated
+    assert (
+        tuple(df.dtypes),
+        pd.util.hash_pandas_object(df, index=False).values.tobytes(),
+    ) == before
+
+    #threshold > 1 -> error
+    with pytest.raises(TypeError, match=_BAD_RATIO_MSG):
+        optimize_categorical(df, max_unique_ratio=2)
+
+    #threshold < 0 -> error
+    with pytest.raises(TypeError, match=_BAD_RATIO_MSG):
+        optimize_categorical(df, max_unique_ratio=-0.5)
+
+
+@pytest.mark.parametrize(
+    "max_unique_ratio,column,expect_category",
+    [
+        (0.5, "id", False),   # 0.8 unique ratio > 0.5 -> untouched
+        (0.9, "id", True),    # 0.8 <= 0.9 -> converted
+        (0.2, "id", False),
+        (0.1, "brand", False),  # all-None column is skipped entirely
+    ],
+)
+def test_optimize_categorical_threshold_variants(threshold_data, max_unique_ratio, column, expect_category):
+    """Threshold behavior with an all-None column present, one case per parameter."""
+    df = threshold_data.copy(deep=True)
+    df["brand"] = None
+
+    output = optimize_categorical(df, max_unique_ratio=max_unique_ratio)
+
+    assert (str(output[column].dtype) == "category") == expect_category
+
+
+def test_optimize_categorical_invalid_inputs():
+    df = pd.DataFrame(
+        {"city": ["NYC", "LA", "NYC", "LA"]}
+        )
+
+    # Test invalid threshold values
+    with pytest.raises(TypeError, match=_BAD_RATIO_MSG):
+        optimize_categorical(df, max_unique_ratio=2)
+    
+    with pytest.raises(TypeError, match=_BAD_RATIO_MSG):
+        optimize_categorical(df, max_unique_ratio=-0.5)
+    
+    # Test invalid type for threshold
+    with pytest.raises(TypeError, match=_RATIO_TYPE_MSG):
+        optimize_categorical(df, max_unique_ratio="30%")
+    
+    # Test invalid df input
+    with pytest.raises(TypeError, match=_NOT_DF_MSG):
+        optimize_categorical(["A", "B", "C"], max_unique_ratio=0.8)
+
+@pytest.mark.parametrize(
+    "bad_input",
+    [["A", "B", "C", "D", "E"], "not a dataframe", None],
+    ids=["list", "str", "none"],
+)
+def test_optimize_categorical_not_df(bad_input):
+    with pytest.raises(TypeError, match=_NOT_DF_MSG):
+        optimize_categorical(bad_input, max_unique_ratio=0.8)
+
+def test_optimize_categrical_empty_and_special_cases():
+    
+    # Test empty DataFrame
+    df_empty = pd.DataFrame({"col1": [], "col2": []})
+
+    output_empty = optimize_categorical(df_empty, max_unique_ratio=0.4)
+    assert len(output_empty) == 0
+    assert df_empty.columns.tolist() == output_empty.columns.tolist()
+    
+    # Test DataFrame with only non-string columns
+    df_numeric = pd.DataFrame({
+        "int_col": [1, 2, 3],
+        "float_col": [1.1, 2.2, 3.3],
+        "bool_col": [True, False, True]
+    })
+    output_numeric = optimize_categorical(df_numeric, max_unique_ratio=0.5)
+    assert df_numeric.equals(output_numeric)  # No changes expected
+    
+    # Test DataFrame with NaN values in string columns
+    df_nan = pd.DataFrame({
+        "category": ["A", "B", "A", None, "B", "A", None, "B", "A", "B"],
+        "text": ["text"] * 10
+    })
+    output_nan = optimize_categorical(df_nan, max_unique_ratio=0.5)
+    # Should handle NaN appropriately
+
+    assert str(output_nan["category"].dtype) == "category"
+
+def test_optimize_categorical_single_value_column():
+    """Test that columns with only one unique value are converted to category."""
+    df = pd.DataFrame({
+        "all_same": ["A"] * 100,  # 1 unique / 100 rows = 0.01
+        "also_same": ["XYZ"] * 100,  # 1 unique / 100 rows = 0.01
+        "varied": [f"item_{i}" for i in range(100)]  # 100 unique / 100 rows = 1.0
+    })
+    
+    output = optimize_categorical(df, max_unique_ratio=0.5)
+    
+    # Single-value columns should be converted (ratio = 0.01 << 0.5)
+    assert str(output["all_same"].dtype) == "category"
+    assert str(output["also_same"].dtype) == "category"
+    
+    # High-cardinality column should NOT be converted (ratio = 1.0 > 0.5)
+    assert not isinstance(output["varied"].dtype, pd.CategoricalDtype)
+    
+    # Verify values are preserved
+    assert output["all_same"].unique().tolist() == ["A"]
+    assert output["also_same"].unique().tolist() == ["XYZ"]
+    
+    # Should report 2 columns converted
+    assert output.attrs["converted_columns"] == 2
\ No newline at end of file
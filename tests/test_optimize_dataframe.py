@@ -4,9 +4,13 @@ import pytest
 
 from group_32.optimize_dataframe import optimize_dataframe
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def df_mixed():
-    """A small mixed-type DataFrame that should trigger numeric + categorical + analysis."""
+    """A small mixed-type DataFrame that should trigger numeric + categorical + analysis.
+
+    Module-scoped: every consumer treats it as read-only (the wrapper never
+    mutates its input), so one BlockManager build serves all of them.
+    """
     return pd.DataFrame(
         {
             "region": ["US", "CA", "US", "US"],  # low-cardinality object -> category
@@ -16,15 +20,15 @@ def df_mixed():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def df_empty():
     """Empty DataFrame should not crash."""
     return pd.DataFrame()
 
 
-def test_optimize_dataframe_wrapper_applies_numeric_and_categorical_and_runs_analysis(df_mixed, capsys):
+def test_optimize_dataframe_wrapper_applies_numeric_and_categorical_and_runs_analysis(df_mixed, frame_fingerprint, capsys):
     df = df_mixed
-    df_before = df.copy(deep=True)
+    before = frame_fingerprint(df)
 
     out = optimize_dataframe(df)
     captured = capsys.readouterr().out
@@ -34,7 +38,7 @@ def test_optimize_dataframe_wrapper_applies_numeric_and_categorical_and_runs_ana
     assert str(out["quantity"].dtype) in {"int8", "int16", "int32"}, "Expected 'quantity' to be downcast to a smaller int dtype."
 
     # should not mutate original
-    pd.testing.assert_frame_equal(df, df_before)
+    assert frame_fingerprint(df) == before
 
     # analysis should run (prints header)
     assert "Special Column Analysis" in captured, "Expected optimize_special to print analysis header."
@@ -45,6 +49,63 @@ def test_optimize_dataframe_raises_type_error_for_non_dataframe():
         optimize_dataframe([1, 2, 3])
 
 
+def test_optimize_dataframe_rejects_unknown_engine(df_mixed):
+    with pytest.raises(TypeError, match="engine must be one of"):
+        optimize_dataframe(df_mixed, engine="dask")
+
+
+def test_optimize_dataframe_engine_pandas_matches_default(df_mixed, capsys):
+    out = optimize_dataframe(df_mixed, engine="pandas")
+    _ = capsys.readouterr().out
+
+    assert str(out["region"].dtype) == "category"
+    assert str(out["price"].dtype) == "float32"
+
+
+def test_optimize_dataframe_engine_polars_routes_to_polars_path(monkeypatch, df_mixed, capsys):
+    """engine="polars" must go through _polars_path (and still run the analysis)."""
+    calls = {"polars": 0}
+    optimized = df_mixed.copy()
+
+    def fake_polars_path(dfin, max_unique_ratio=0.5):
+        calls["polars"] += 1
+        return optimized
+
+    # Patch the names as used inside the optimize_dataframe module so the
+    # routing is testable even when polars itself is not installed.
+    monkeypatch.setattr("group_32.optimize_dataframe.pl", object())
+    monkeypatch.setattr("group_32.optimize_dataframe._polars_path", fake_polars_path)
+
+    out = optimize_dataframe(df_mixed, engine="polars")
+    captured = capsys.readouterr().out
+
+    assert calls["polars"] == 1
+    assert out is optimized
+    assert "Special Column Analysis" in captured
+
+
+def test_optimize_dataframe_polars_path_real_engine(capsys):
+    """Run the actual polars path, including the zero-row frame that used to divide by zero."""
+    pytest.importorskip("polars")
+
+    df = pd.DataFrame(
+        {
+            "region": ["US", "CA", "US", "US"],
+            "quantity": np.array([1, 2, 3, 4], dtype=np.int64),
+        }
+    )
+    out = optimize_dataframe(df, engine="polars")
+    _ = capsys.readouterr().out
+    assert str(out["region"].dtype) == "category"
+    assert out["quantity"].dtype.itemsize < 8
+
+    empty = pd.DataFrame({"s": pd.Series([], dtype=str)})
+    out_empty = optimize_dataframe(empty, engine="polars")
+    _ = capsys.readouterr().out
+    assert len(out_empty) == 0
+    assert list(out_empty.columns) == ["s"]
+
+
 def test_optimize_dataframe_empty_dataframe_returns_empty(df_empty, capsys):
     out = optimize_dataframe(df_empty)
     captured = capsys.readouterr().out
@@ -54,38 +115,38 @@ def test_optimize_dataframe_empty_dataframe_returns_empty(df_empty, capsys):
     assert "Special Column Analysis" in captured, "Expected analysis to run even for empty DataFrame."
 
 
-def test_optimize_dataframe_no_object_columns_still_downcasts_numeric(capsys):
+def test_optimize_dataframe_no_object_columns_still_downcasts_numeric(frame_fingerprint, capsys):
     df = pd.DataFrame(
         {
             "a": np.array([1, 2, 3, 4], dtype=np.int64),
             "b": np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float64),
         }
     )
-    df_before = df.copy(deep=True)
+    before = frame_fingerprint(df)
 
     out = optimize_dataframe(df)
     _ = capsys.readouterr().out
 
     assert str(out["b"].dtype) == "float32", "Expected float64 column to downcast to float32."
     assert str(out["a"].dtype) in {"int8", "int16", "int32"}, "Expected int64 column to downcast to a smaller int dtype."
-    pd.testing.assert_frame_equal(df, df_before)
+    assert frame_fingerprint(df) == before
 
 
-def test_optimize_dataframe_no_numeric_columns_still_converts_categorical(capsys):
+def test_optimize_dataframe_no_numeric_columns_still_converts_categorical(frame_fingerprint, capsys):
     df = pd.DataFrame(
         {
             "region": ["US", "CA", "US", "US"],
             "status": ["pending", "shipped", "pending", "pending"],
         }
     )
-    df_before = df.copy(deep=True)
+    before = frame_fingerprint(df)
 
     out = optimize_dataframe(df)
     _ = capsys.readouterr().out
 
     assert str(out["region"].dtype) == "category", "Expected 'region' to become category."
     assert str(out["status"].dtype) == "category", "Expected 'status' to become category."
-    pd.testing.assert_frame_equal(df, df_before)
+    assert frame_fingerprint(df) == before
 
 
 def test_optimize_dataframe_preserves_values(capsys):
@@ -106,6 +167,22 @@ def test_optimize_dataframe_preserves_values(capsys):
     pd.testing.assert_series_equal(out["region"].astype("string"), df["region"].astype("string"), check_names=True)
 
 
+def test_optimize_dataframe_handles_duplicate_column_labels(capsys):
+    """Duplicate labels are valid pandas input; the pipeline must pass them through positionally."""
+    df = pd.DataFrame(
+        [[1, "US", 10], [2, "CA", 20], [3, "US", 30], [4, "US", 40]],
+        columns=["x", "region", "x"],
+    )
+
+    out = optimize_dataframe(df)
+    _ = capsys.readouterr().out
+
+    assert list(out.columns) == ["x", "region", "x"]
+    assert str(out["region"].dtype) == "category"
+    assert str(out.iloc[:, 0].dtype) in {"int8", "int16", "int32"}
+    assert str(out.iloc[:, 2].dtype) in {"int8", "int16", "int32"}
+
+
 def test_optimize_dataframe_calls_helpers(monkeypatch, df_mixed, capsys):
     """
     Branch-style test for wrapper logic: prove wrapper calls each helper exactly once.
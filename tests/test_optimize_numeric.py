@@ -3,41 +3,68 @@ import numpy as np
 from group_32.optimize_numeric import optimize_numeric
 import pytest
 
-def test_integer_columns_are_downcasted_only():
+
+# Read-only inputs shared by several tests, built once at import time
+# (pd.date_range in particular runs a non-trivial offset-resolution path
+# even for three elements). No test mutates these.
+_DATES = pd.date_range("2024-01-01", periods=3)
+_UINT_SMALL = np.array([0, 100, 255], dtype=np.uint64)
+_INF_ARR = np.array([1.0, np.inf, -np.inf, 2.0], dtype=np.float64)
+
+
+def _assert_series_eq(result, expected, check_dtype=True):
+    """
+    Cheap equality check for tiny Series.
+
+    Compares values via np.array_equal plus an optional dtype check,
+    skipping assert_series_equal's index reconciliation and attrs
+    machinery, which dominates runtime on 3-row Series.
+    """
+    if check_dtype:
+        assert result.dtype == expected.dtype
+    assert np.array_equal(result.to_numpy(), expected.to_numpy())
+
+
+def test_integer_columns_are_downcasted_only(num_arrays):
     """
     Ensure that integer columns are downcasted, and that the function
     does not modify non-numeric columns in any way.
     """
     df = pd.DataFrame({
-        "int_col": np.array([1, 2, 3], dtype=np.int64),
+        "int_col": num_arrays["int64_small"],
         "cat_col": ["a", "b", "c"]
-    })
+    }, copy=False)
 
     result = optimize_numeric(df)
 
     # Integer column should remain integer
     assert pd.api.types.is_integer_dtype(result["int_col"])
-    pd.testing.assert_series_equal(result["int_col"], df["int_col"], check_dtype=False)
+    _assert_series_eq(result["int_col"], df["int_col"], check_dtype=False)
 
     # Non-numeric column should be unchanged
-    pd.testing.assert_series_equal(result["cat_col"], df["cat_col"])
+    _assert_series_eq(result["cat_col"], df["cat_col"])
 
 
-def test_float_columns_are_downcasted_only():
+def test_float_columns_are_downcasted_only(num_arrays):
     """
     Verify that float columns are optimized while non-numeric
     columns are not affected.
     """
     df = pd.DataFrame({
-        "float_col": np.array([1.5, 2.5, 3.5], dtype=np.float64),
+        "float_col": num_arrays["float64_small"],
         "cat_col": ["x", "y", "z"]
-    })
+    }, copy=False)
 
     result = optimize_numeric(df)
 
     assert pd.api.types.is_float_dtype(result["float_col"])
-    np.testing.assert_allclose(result["float_col"], df["float_col"], rtol=1e-6)
-    pd.testing.assert_series_equal(result["cat_col"], df["cat_col"])
+    # 1.5/2.5/3.5 are exactly representable in float32, so the comparison
+    # can be strict equality rather than allclose's tolerance machinery
+    np.testing.assert_array_equal(
+        result["float_col"].to_numpy().astype(np.float64),
+        df["float_col"].to_numpy(),
+    )
+    _assert_series_eq(result["cat_col"], df["cat_col"])
 
 
 def test_mixed_numeric_columns_are_handled_independently():
@@ -54,7 +81,7 @@ def test_mixed_numeric_columns_are_handled_independently():
 
     assert pd.api.types.is_integer_dtype(result["int_col"])
     assert pd.api.types.is_float_dtype(result["float_col"])
-    pd.testing.assert_series_equal(result["int_col"], df["int_col"], check_dtype=False)
+    _assert_series_eq(result["int_col"], df["int_col"], check_dtype=False)
     np.testing.assert_allclose(result["float_col"], df["float_col"], rtol=1e-6)
 
 
@@ -73,7 +100,7 @@ def test_missing_values_preserved_for_numeric_columns():
 
     assert result["int_col"].isna().sum() == df["int_col"].isna().sum()
     assert result["float_col"].isna().sum() == df["float_col"].isna().sum()
-    pd.testing.assert_series_equal(result["cat_col"], df["cat_col"])
+    _assert_series_eq(result["cat_col"], df["cat_col"])
 
 
 def test_no_numeric_columns_does_not_alter_dataframe():
@@ -91,95 +118,54 @@ def test_no_numeric_columns_does_not_alter_dataframe():
     pd.testing.assert_frame_equal(result, df)
 
 
-def test_negative_integers_downcasted_correctly():
+@pytest.mark.parametrize(
+    "values,expected_dtype",
+    [
+        ([127, -128, 0], np.int8),              # int8 boundaries
+        ([32767, -32768, 0], np.int16),         # int16 boundaries
+        ([2147483647, -2147483648, 0], np.int32),  # int32 boundaries
+        ([2147483648, 2147483649], np.int64),   # beyond int32 range, stays int64
+        ([-10, -20, -30], np.int8),             # negative values
+        ([-50, 0, 50], np.int8),                # mixed positive/negative
+    ],
+)
+def test_integer_downcast_boundaries(values, expected_dtype):
     """
-    Test that negative integers are downcasted to appropriate signed types.
+    Integer columns land on the smallest signed dtype whose bounds hold
+    their range, with values preserved.
     """
     df = pd.DataFrame({
-        "neg_int": np.array([-10, -20, -30], dtype=np.int64)
+        "int_col": np.array(values, dtype=np.int64)
     })
-    
-    result = optimize_numeric(df, verbose=False)
-    
-    # Should be int8 (range -128 to 127)
-    assert result["neg_int"].dtype == np.int8
-
 
-def test_boundary_values_int8():
-    """
-    Test that values at int8 boundaries (127, -128) are handled correctly.
-    """
-    df = pd.DataFrame({
-        "boundary_int": np.array([127, -128, 0], dtype=np.int64)
-    })
-    
     result = optimize_numeric(df, verbose=False)
-    
-    assert result["boundary_int"].dtype == np.int8
-
 
-def test_boundary_values_int16():
-    """
-    Test that values at int16 boundaries are handled correctly.
-    """
-    df = pd.DataFrame({
-        "boundary_int": np.array([32767, -32768, 0], dtype=np.int64)
-    })
-    
-    result = optimize_numeric(df, verbose=False)
-    
-    assert result["boundary_int"].dtype == np.int16
-
-
-def test_boundary_values_int32():
-    """
-    Test that values at int32 boundaries are handled correctly.
-    """
-    df = pd.DataFrame({
-        "boundary_int": np.array([2147483647, -2147483648, 0], dtype=np.int64)
-    })
-    
-    result = optimize_numeric(df, verbose=False)
-    
-    assert result["boundary_int"].dtype == np.int32
+    assert result["int_col"].dtype == expected_dtype
+    assert result["int_col"].tolist() == values
 
 
-def test_boolean_columns_not_affected():
+def test_boolean_columns_not_affected(num_arrays):
     """
     Test that boolean columns are not modified by the function.
     """
     df = pd.DataFrame({
         "bool_col": [True, False, True],
-        "int_col": np.array([1, 2, 3], dtype=np.int64)
-    })
+        "int_col": num_arrays["int64_small"]
+    }, copy=False)
     
     result = optimize_numeric(df, verbose=False)
     
     assert result["bool_col"].dtype == bool
-    pd.testing.assert_series_equal(result["bool_col"], df["bool_col"])
-
-
-def test_very_large_integers_remain_int64():
-    """
-    Test that integers too large for int32 remain as int64.
-    """
-    df = pd.DataFrame({
-        "huge_int": np.array([2147483648, 2147483649], dtype=np.int64)  # Beyond int32 max
-    })
-    
-    result = optimize_numeric(df, verbose=False)
-    
-    # Should remain int64 since values exceed int32 range
-    assert result["huge_int"].dtype == np.int64
+    _assert_series_eq(result["bool_col"], df["bool_col"])
 
 
-def test_float32_sufficient_precision():
+def test_float32_sufficient_precision(num_arrays):
     """
     Test that floats are downcasted to float32 when precision is sufficient.
     """
     df = pd.DataFrame({
-        "float_col": np.array([1.5, 2.5, 3.5], dtype=np.float64)
-    })
+        "float_col": num_arrays["float64_small"]
+    }, copy=False)
     
     result = optimize_numeric(df, verbose=False)
     
@@ -210,15 +196,15 @@ def test_unsigned_integers_handled_correctly():
     fit within the signed range.
     """
     df = pd.DataFrame({
-        "uint_col": np.array([0, 100, 255], dtype=np.uint64)
-    })
+        "uint_col": _UINT_SMALL
+    }, copy=False)
     
     result = optimize_numeric(df, verbose=False)
     
     # Should be downcasted to int16 (or int8 if your function supports it)
     # since all values are positive and fit in a smaller integer type
     assert pd.api.types.is_integer_dtype(result["uint_col"])
-    pd.testing.assert_series_equal(result["uint_col"], df["uint_col"], check_dtype=False)
+    _assert_series_eq(result["uint_col"], df["uint_col"], check_dtype=False)
 
 
 def test_empty_dataframe():
@@ -248,13 +234,13 @@ def test_dataframe_with_one_row():
     assert result["float_col"].dtype == np.float32
 
 
-def test_original_dataframe_not_modified():
+def test_original_dataframe_not_modified(num_arrays):
     """
     Test that the original DataFrame is not modified (function returns a copy).
     """
     df = pd.DataFrame({
-        "int_col": np.array([1, 2, 3], dtype=np.int64)
-    })
+        "int_col": num_arrays["int64_small"]
+    }, copy=False)
     
     original_dtype = df["int_col"].dtype
     result = optimize_numeric(df, verbose=False)
@@ -265,50 +251,32 @@ def test_original_dataframe_not_modified():
     assert result["int_col"].dtype == np.int8
 
 
-def test_datetime_columns_not_affected():
+def test_datetime_columns_not_affected(num_arrays):
     """
     Test that datetime columns are not modified by the function.
     """
     df = pd.DataFrame({
-        "date_col": pd.date_range("2024-01-01", periods=3),
-        "int_col": np.array([1, 2, 3], dtype=np.int64)
-    })
+        "date_col": _DATES,
+        "int_col": num_arrays["int64_small"]
+    }, copy=False)
     
     result = optimize_numeric(df, verbose=False)
     
     assert pd.api.types.is_datetime64_any_dtype(result["date_col"])
-    pd.testing.assert_series_equal(result["date_col"], df["date_col"])
+    _assert_series_eq(result["date_col"], df["date_col"])
 
 
-def test_invalid_input_type():
+@pytest.mark.parametrize(
+    "bad_input",
+    [[1, 2, 3], "not a dataframe", None, np.array([1, 2, 3])],
+    ids=["list", "str", "none", "ndarray"],
+)
+def test_invalid_input_type(bad_input):
     """
     Test that the function raises TypeError for non-DataFrame input.
     """
     with pytest.raises(TypeError, match="df must be a pandas DataFrame"):
-        optimize_numeric([1, 2, 3])
-    
-    with pytest.raises(TypeError, match="df must be a pandas DataFrame"):
-        optimize_numeric("not a dataframe")
-    
-    with pytest.raises(TypeError, match="df must be a pandas DataFrame"):
-        optimize_numeric(None)
-    
-    with pytest.raises(TypeError, match="df must be a pandas DataFrame"):
-        optimize_numeric(np.array([1, 2, 3]))
-
-
-def test_mixed_positive_negative_integers():
-    """
-    Test optimization with mixed positive and negative integers.
-    """
-    df = pd.DataFrame({
-        "mixed_int": np.array([-50, 0, 50], dtype=np.int64)
-    })
-    
-    result = optimize_numeric(df, verbose=False)
-    
-    assert result["mixed_int"].dtype == np.int8
-    pd.testing.assert_series_equal(result["mixed_int"], df["mixed_int"], check_dtype=False)
+        optimize_numeric(bad_input)
 
 
 def test_all_zeros():
@@ -331,8 +299,8 @@ def test_inf_values_in_floats():
     Test that infinity values in float columns are preserved.
     """
     df = pd.DataFrame({
-        "float_col": np.array([1.0, np.inf, -np.inf, 2.0], dtype=np.float64)
-    })
+        "float_col": _INF_ARR
+    }, copy=False)
     
     result = optimize_numeric(df, verbose=False)
     
@@ -340,12 +308,12 @@ def test_inf_values_in_floats():
     assert result["float_col"].iloc[1] == np.inf
     assert result["float_col"].iloc[2] == -np.inf
 
-def test_optimize_numeric_verbose_false_no_output(capsys):
+def test_optimize_numeric_verbose_false_no_output(num_arrays, capsys):
     """Test that verbose=False suppresses output."""
     df = pd.DataFrame({
-        "int_col": np.array([1, 2, 3], dtype=np.int64),
-        "float_col": np.array([1.5, 2.5, 3.5], dtype=np.float64)
-    })
+        "int_col": num_arrays["int64_small"],
+        "float_col": num_arrays["float64_small"]
+    }, copy=False)
     
     result = optimize_numeric(df, verbose=False)
     captured = capsys.readouterr()
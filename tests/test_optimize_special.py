@@ -0,0 +1,204 @@
+import pandas as pd
+import pytest
+from group_32.optimize_special import optimize_special
+
+def test_optimize_special_raises_type_error_for_non_dataframe():
+    with pytest.raises(TypeError, match="df must be a pandas DataFrame"):
+        optimize_special([1, 2, 3])
+
+
+def test_optimize_special_empty_dataframe_prints_empty_message(capsys):
+    df = pd.DataFrame()
+    result = optimize_special(df)
+    captured = capsys.readouterr().out
+    assert result == {}
+    assert "Special Column Analysis" in captured
+    assert "(DataFrame is empty)" in captured
+
+
+def test_optimize_special_category_branch(capsys):
+    # Triggers the already-categorical check; the printed line and the
+    # structured report must agree.
+    df = pd.DataFrame(
+        {
+            "membership_level": pd.Categorical(["gold", "silver", "gold"])
+        }
+    )
+    report = optimize_special(df)
+    captured = capsys.readouterr().out
+    assert report == {"membership_level": "categorical"}
+    assert "Special Column Analysis" in captured
+    assert "membership_level: Identified as categorical or ordinal data (category dtype)." in captured
+
+
+def test_optimize_special_coordinate_branch():
+    # Triggers: if name.strip().lower() in coord_names
+    df = pd.DataFrame(
+        {
+            "lat": [49.28, 49.29, 49.30],
+            "longitude": [-123.12, -123.11, -123.10],
+        }
+    )
+    report = optimize_special(df, verbose=False)
+    assert report == {
+        "lat": "geographic_coordinate",
+        "longitude": "geographic_coordinate",
+    }
+
+
+def test_optimize_special_unique_id_branch_high_cardinality():
+    # Triggers: if id_regex.search(name) and unique_ratio >= 0.9
+    df = pd.DataFrame(
+        {
+            "customer_id": range(10)  # 10 unique / 10 rows = 1.0 >= 0.9
+        }
+    )
+    report = optimize_special(df, verbose=False)
+    assert report == {"customer_id": "unique_id"}
+
+
+def test_optimize_special_text_entity_branch_high_cardinality_object():
+    # Triggers: object dtype (object or string) + unique_ratio > 0.5 + not matching id_regex
+    df = pd.DataFrame(
+        {
+            "full_name": [f"Person {i}" for i in range(10)]  # 10 unique / 10 rows = 1.0 > 0.5
+        }
+    )
+    report = optimize_special(df, verbose=False)
+    assert report == {"full_name": "high_cardinality_text"}
+
+
+def test_optimize_special_does_not_flag_low_cardinality_object(capsys):
+    # Ensures the "text entity" branch does NOT trigger when unique_ratio <= 0.5
+    df = pd.DataFrame(
+        {
+            "city": ["NYC", "LA", "NYC", "LA"]  # 2 unique / 4 rows = 0.5 (not > 0.5)
+        }
+    )
+    report = optimize_special(df)
+    captured = capsys.readouterr().out
+    # It will print the header, but city must not be classified
+    assert "Special Column Analysis" in captured
+    assert "city: Identified as high-cardinality text column." not in captured
+    assert "city" not in report
+
+
+def test_optimize_special_id_named_but_not_high_cardinality_not_flagged():
+    # Ensures the "unique ID" branch does NOT trigger if ratio < 0.9
+    df = pd.DataFrame(
+        {
+            "order_id": ["A", "A", "B", "B", "B"]  # 2 unique / 5 = 0.4 < 0.9
+        }
+    )
+    report = optimize_special(df, verbose=False)
+    assert "order_id" not in report
+
+
+def test_optimize_special_dataframe_not_modified():
+    # Since optimize_special is analysis only, confirm no mutation.
+    df = pd.DataFrame(
+        {
+            "customer_id": range(5),
+            "lat": [1.0] * 5,
+            "name": ["a", "b", "c", "d", "e"],
+            "membership_level": pd.Categorical(["x", "y", "x", "y", "x"]),
+        }
+    )
+    df_before = df.copy(deep=True)
+    optimize_special(df)
+    pd.testing.assert_frame_equal(df, df_before)
+
+
+#All-null column skip logic
+def test_optimize_special_skips_all_null_columns():
+    """Test that columns with all NaN/None values are silently skipped."""
+    df = pd.DataFrame(
+        {
+            "all_null_col": [None, None, None, None],
+            "valid_col": ["A", "B", "C", "D"]  # Low cardinality, won't be flagged
+        }
+    )
+    report = optimize_special(df, verbose=False)
+
+    # The all-null column is skipped outright, never classified
+    assert "all_null_col" not in report
+
+
+# Coordinate column with whitespace in name
+def test_optimize_special_coordinate_with_whitespace():
+    """Test that coordinate column names with leading/trailing whitespace are recognized."""
+    df = pd.DataFrame(
+        {
+            "  latitude  ": [37.7749, 37.7750, 37.7751],
+            " lon ": [-122.4194, -122.4195, -122.4196]
+        }
+    )
+    report = optimize_special(df, verbose=False)
+
+    assert report["  latitude  "] == "geographic_coordinate"
+    assert report[" lon "] == "geographic_coordinate"
+
+
+#Unique ID threshold boundary (check is >= 0.9)
+@pytest.mark.parametrize(
+    "values,flagged",
+    [
+        (list(range(9)) + [8], True),      # 9 unique / 10 rows = 0.9, exactly at threshold
+        (list(range(8)) + [7, 7], False),  # 8 unique / 10 rows = 0.8 < 0.9
+    ],
+    ids=["at_threshold", "below_threshold"],
+)
+def test_optimize_special_unique_id_boundary(values, flagged):
+    """Test unique ID detection on both sides of the 0.9 ratio boundary."""
+    df = pd.DataFrame({"user_id": values})
+    report = optimize_special(df, verbose=False)
+
+    assert ("user_id" in report) == flagged
+
+
+#Text entity threshold boundary (check is > 0.5, not >=)
+@pytest.mark.parametrize(
+    "values,flagged",
+    [
+        (["A", "B", "C", "D", "E"] * 2, False),                     # 5 unique / 10 rows = 0.5
+        ([f"Comment {i}" for i in range(6)] + ["Comment 0"] * 4, True),  # 6 unique / 10 rows = 0.6
+    ],
+    ids=["at_threshold", "above_threshold"],
+)
+def test_optimize_special_text_entity_boundary(values, flagged):
+    """Test text entity detection on both sides of the 0.5 ratio boundary."""
+    df = pd.DataFrame({"description": values})
+    report = optimize_special(df, verbose=False)
+
+    assert ("description" in report) == flagged
+
+
+#Numeric columns with high cardinality should NOT be flagged as text entities
+def test_optimize_special_numeric_high_cardinality_not_flagged_as_text():
+    """Test that numeric columns with high cardinality are not flagged as text entities."""
+    df = pd.DataFrame(
+        {
+            "price": [100.0 + i for i in range(10)],  # 10 unique / 10 rows = 1.0, but numeric
+            "quantity": range(10)  # Also numeric with high cardinality
+        }
+    )
+    report = optimize_special(df, verbose=False)
+
+    # Numeric columns must not be flagged as text entities
+    assert report == {}
+
+def test_optimize_special_mixed_case_coordinate_names():
+    """Test that coordinate columns with mixed case names are recognized."""
+    df = pd.DataFrame({
+        "Latitude": [49.28, 49.29, 49.30],
+        "LONGITUDE": [-123.12, -123.11, -123.10],
+        "LoN": [-122.41, -122.42, -122.43]
+    })
+
+    report = optimize_special(df, verbose=False)
+
+    assert report == {
+        "Latitude": "geographic_coordinate",
+        "LONGITUDE": "geographic_coordinate",
+        "LoN": "geographic_coordinate",
+    }
\ No newline at end of file